@@ -2,8 +2,22 @@
 Plot a ``Trading History`` dataset using seaborn and matplotlib
 """
 
+import os
+import concurrent.futures
 import datetime
+import functools
+import hashlib
+import logging
+import numpy as np
+import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
+try:
+    from numba import njit
+    from numba import prange
+except ImportError:
+    njit = None
+    prange = range
 import analysis_engine.consts as ae_consts
 import analysis_engine.utils as ae_utils
 import analysis_engine.charts as ae_charts
@@ -13,6 +27,207 @@ import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
 
+# bind the default plot colors once at import time - the
+# dict lookups otherwise repeat on every call which adds up
+# when a backtest renders thousands of charts
+_RED = ae_consts.PLOT_COLORS['red']
+_BLUE = ae_consts.PLOT_COLORS['blue']
+_DARKGREEN = ae_consts.PLOT_COLORS['darkgreen']
+_ORANGE = ae_consts.PLOT_COLORS['orange']
+
+# backend names that never display anything - safe to swap
+# for Agg (hardcoded because rcsetup.non_interactive_bk was
+# removed in newer matplotlib releases)
+_NON_INTERACTIVE_BACKENDS = (
+    'agg',
+    'cairo',
+    'pdf',
+    'pgf',
+    'ps',
+    'svg',
+    'template')
+
+# track whether the shared seaborn fonts were already pushed
+# into matplotlib's rcParams - the validators run per key so
+# re-applying the same fonts every plot is pure overhead
+_COMMON_FONTS_SET = False
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_start_date(start_date):
+    """_parse_start_date
+
+    Parse and memoize a ``start_date`` string - backtests
+    re-render many charts over the same window so the same
+    string rarely needs parsing twice
+
+    :param start_date: string ``datetime`` formatted with
+        ``ae_consts.COMMON_TICK_DATE_FORMAT``
+    """
+    return datetime.datetime.strptime(
+        start_date,
+        ae_consts.COMMON_TICK_DATE_FORMAT)
+# end of _parse_start_date
+
+
+def _dataframe_fingerprint(use_df):
+    """_dataframe_fingerprint
+
+    Reduce a ``pandas.DataFrame`` to a single int in one
+    hashing pass - computed once per plot and shared by the
+    figure cache key and any downstream idempotence checks
+    so the same rows are never re-hashed
+
+    :param use_df: filtered ``pandas.DataFrame``
+        getting plotted
+    """
+    return int(pd.util.hash_pandas_object(
+        use_df,
+        index=True).values.sum())
+# end of _dataframe_fingerprint
+
+
+def _build_figure_cache_key(
+        df_fingerprint,
+        cache_parts):
+    """_build_figure_cache_key
+
+    Build a cache key for a rendered plot from the plot
+    arguments and a precomputed data fingerprint - the same
+    arguments over the same rows always map to the same key
+
+    :param df_fingerprint: int from
+        ``_dataframe_fingerprint`` over the filtered
+        ``pandas.DataFrame`` getting plotted
+    :param cache_parts: tuple of plot arguments that
+        change the rendered output
+    """
+    return hashlib.md5(
+        repr((df_fingerprint,) + cache_parts).encode(
+            'utf-8')).hexdigest()
+# end of _build_figure_cache_key
+
+
+def _minmax_bucket_idxs(
+        col_values,
+        num_buckets,
+        bucket_size):
+    """_minmax_bucket_idxs
+
+    Scan one column and return the row position of the min
+    and the max inside every bucket - the tight numeric loop
+    behind ``_downsample_indices`` that numba jit-compiles
+    when it is installed. All-NaN buckets report ``-1``
+
+    :param col_values: float64 ``numpy.ndarray`` of the
+        column's values
+    :param num_buckets: int number of buckets to scan
+    :param bucket_size: float rows per bucket
+    """
+    out_idxs = np.full(num_buckets * 2, -1, dtype=np.int64)
+    num_rows = col_values.shape[0]
+    for bucket_idx in prange(num_buckets):
+        bucket_start = int(bucket_idx * bucket_size)
+        bucket_end = int((bucket_idx + 1) * bucket_size)
+        if bucket_end > num_rows:
+            bucket_end = num_rows
+        min_idx = -1
+        max_idx = -1
+        min_val = 0.0
+        max_val = 0.0
+        for row_idx in range(bucket_start, bucket_end):
+            cur_val = col_values[row_idx]
+            if cur_val != cur_val:
+                # NaN never equals itself
+                continue
+            if min_idx == -1:
+                min_val = cur_val
+                max_val = cur_val
+                min_idx = row_idx
+                max_idx = row_idx
+            else:
+                if cur_val < min_val:
+                    min_val = cur_val
+                    min_idx = row_idx
+                if cur_val > max_val:
+                    max_val = cur_val
+                    max_idx = row_idx
+        out_idxs[bucket_idx * 2] = min_idx
+        out_idxs[(bucket_idx * 2) + 1] = max_idx
+    # end of for all buckets
+
+    return out_idxs
+# end of _minmax_bucket_idxs
+
+
+if njit:
+    # compile the bucket scan once per process and cache the
+    # compiled kernel on disk so the first-call cost is only
+    # paid on the very first run - no fastmath because the
+    # kernel's NaN skip needs IEEE NaN semantics
+    _minmax_bucket_idxs = njit(
+        cache=True,
+        parallel=True)(_minmax_bucket_idxs)
+
+
+def _downsample_indices(
+        df,
+        plot_columns,
+        max_points):
+    """_downsample_indices
+
+    Select a bounded set of row positions to plot when the
+    ``df`` has more rows than the chart has pixels. Every
+    plotted column keeps the min and max row from each bucket
+    (plus the first and last rows) so spikes and dips survive
+    the downsample - the same preselection ``MinMaxLTTB``
+    runs before its triangle pass
+
+    :param df: ``pandas.DataFrame`` already reduced to the
+        rows and columns getting plotted
+    :param plot_columns: list of column names getting plotted
+    :param max_points: max number of points to keep per column
+    """
+    num_rows = len(df.index)
+    num_buckets = max(int(max_points / 2), 1)
+    bucket_size = num_rows / num_buckets
+    keep_idxs = {0, num_rows - 1}
+    for column_name in plot_columns:
+        col_values = df[column_name].values
+        if njit:
+            bucket_idxs = _minmax_bucket_idxs(
+                np.ascontiguousarray(
+                    col_values,
+                    dtype=np.float64),
+                num_buckets,
+                bucket_size)
+            for keep_idx in bucket_idxs:
+                if keep_idx >= 0:
+                    keep_idxs.add(int(keep_idx))
+            continue
+        # without numba fall back to the vectorized
+        # per-bucket numpy scan
+        for bucket_idx in range(num_buckets):
+            bucket_start = int(bucket_idx * bucket_size)
+            bucket_end = min(
+                int((bucket_idx + 1) * bucket_size),
+                num_rows)
+            if bucket_end <= bucket_start:
+                continue
+            bucket = col_values[bucket_start:bucket_end]
+            try:
+                keep_idxs.add(
+                    bucket_start + int(np.nanargmin(bucket)))
+                keep_idxs.add(
+                    bucket_start + int(np.nanargmax(bucket)))
+            except ValueError:
+                # all-NaN bucket - nothing worth keeping
+                continue
+    # end of for all plotted columns
+
+    return sorted(keep_idxs)
+# end of _downsample_indices
+
 
 def plot_trading_history(
         title,
@@ -44,8 +259,11 @@ def plot_trading_history(
         footnote_color='#888888',
         footnote_fontsize=8,
         scale_y=False,
+        max_points=2000,
+        low_precision=True,
         show_plot=True,
         dropna_for_all=False,
+        cache_dir=None,
         verbose=False,
         send_plots_to_slack=False):
     """plot_trading_history
@@ -121,20 +339,49 @@ def plot_trading_history(
 
             use_ax.set_ylim(
                 [0, use_ax.get_ylim()[1] * 3])
+    :param max_points: optional - int maximum number of points
+        to plot per column - when the filtered ``df`` has more
+        rows, each plotted column keeps the min and max from
+        every bucket of rows so spikes still show while the
+        render cost stays bounded by the screen's pixels
+        instead of the dataset's size
+        (default is ``2000`` and ``None`` disables downsampling)
+    :param low_precision: optional - bool to downcast float64
+        columns to float32 before rendering - matplotlib only
+        needs screen-pixel precision so this halves the bytes
+        streamed into the renderer (set to ``False`` for
+        publication-quality output)
     :param show_plot: bool to show the plot
     :param dropna_for_all: optional - bool to toggle keep None's in
         the plot ``df`` (default is drop them for display purposes)
+    :param cache_dir: optional - string path to a directory for
+        caching rendered plots as png files - when set with
+        ``show_plot=False`` a repeat call over the same arguments
+        and the same data returns the already-rendered file in
+        ``rec['cache_png']`` without rebuilding the figure
     :param verbose: optional - bool to show logs for debugging
         a dataset
     :param send_plots_to_slack: optional - bool to send the dnn plot to slack
     """
 
+    if not show_plot:
+        # headless batch renders only need the Agg raster
+        # backend - but use() switches via switch_backend
+        # which closes every open figure and would pin a
+        # live jupyter/gui session to Agg, so only move off
+        # another backend that is already non-interactive
+        if matplotlib.get_backend().lower() in (
+                _NON_INTERACTIVE_BACKENDS):
+            matplotlib.use('Agg', force=False)
+
     rec = {
         'ax1': None,
         'ax2': None,
         'ax3': None,
         'ax4': None,
-        'fig': None
+        'fig': None,
+        'cache_png': None,
+        'df_fingerprint': None
     }
     result = build_result.build_result(
         status=ae_consts.NOT_RUN,
@@ -144,19 +391,10 @@ def plot_trading_history(
     if verbose:
         log.info('plot_trading_history - start')
 
-    use_red = red_color
-    use_blue = blue_color
-    use_green = green_color
-    use_orange = orange_color
-
-    if not use_red:
-        use_red = ae_consts.PLOT_COLORS['red']
-    if not use_blue:
-        use_blue = ae_consts.PLOT_COLORS['blue']
-    if not use_green:
-        use_green = ae_consts.PLOT_COLORS['darkgreen']
-    if not use_orange:
-        use_orange = ae_consts.PLOT_COLORS['orange']
+    use_red = red_color or _RED
+    use_blue = blue_color or _BLUE
+    use_green = green_color or _DARKGREEN
+    use_orange = orange_color or _ORANGE
 
     use_footnote = footnote_text
     if not use_footnote:
@@ -179,66 +417,69 @@ def plot_trading_history(
         date_col
     ]
 
-    all_plots = []
+    # parallel lists instead of a list of dicts - the plot
+    # loop walks them with zip and the columns slice straight
+    # into pandas/numpy without per-node dict lookups
+    plot_cols = []
+    plot_colors = []
     if red:
         column_list.append(red)
-        all_plots.append({
-            'column': red,
-            'color': use_red})
+        plot_cols.append(red)
+        plot_colors.append(use_red)
     else:
         if 'high' in df:
             red = 'high'
             column_list.append(red)
-            all_plots.append({
-                'column': 'high',
-                'color': use_red})
+            plot_cols.append(red)
+            plot_colors.append(use_red)
     if blue:
         column_list.append(blue)
-        all_plots.append({
-            'column': blue,
-            'color': use_blue})
+        plot_cols.append(blue)
+        plot_colors.append(use_blue)
     else:
         if 'close' in df:
             blue = 'close'
             column_list.append(blue)
-            all_plots.append({
-                'column': 'close',
-                'color': use_blue})
+            plot_cols.append(blue)
+            plot_colors.append(use_blue)
     if green:
         column_list.append(green)
-        all_plots.append({
-            'column': green,
-            'color': use_green})
+        plot_cols.append(green)
+        plot_colors.append(use_green)
     if orange:
         column_list.append(orange)
-        all_plots.append({
-            'column': orange,
-            'color': use_orange})
+        plot_cols.append(orange)
+        plot_colors.append(use_orange)
 
     use_df = df
-    if start_date:
-        start_date_value = datetime.datetime.strptime(
-            start_date,
-            ae_consts.COMMON_TICK_DATE_FORMAT)
-        use_df = df[(df[date_col] >= start_date_value)][column_list]
-    # end of filtering by start date
-
-    if verbose:
+    if start_date or hasattr(df_filter, 'to_json'):
+        # build one boolean mask and slice the df a single
+        # time instead of chaining subselects that each copy
+        # the frame - the chained version also applied a
+        # df_filter built against the original df after
+        # start_date had already dropped rows which
+        # misaligned the indexes
+        mask = np.ones(len(df.index), dtype=bool)
+        if start_date:
+            start_date_value = _parse_start_date(start_date)
+            mask &= (df[date_col] >= start_date_value).values
+        if hasattr(df_filter, 'to_json'):
+            # Was seeing this warning below in Jupyter:
+            # UserWarning: Boolean Series key
+            # will be reindexed to match DataFrame index
+            # use_df = use_df[df_filter][column_list]
+            # now using the raw mask values:
+            mask &= df_filter.values
+        use_df = df.loc[mask, column_list]
+    # end of filtering by start date and df_filter
+
+    if verbose and log.isEnabledFor(logging.INFO):
         log.info(
-            f'plot_history_df start_date={start_date} '
-            f'df.index={len(use_df.index)} column_list={column_list}')
-
-    if hasattr(df_filter, 'to_json'):
-        # Was seeing this warning below in Jupyter:
-        # UserWarning: Boolean Series key
-        # will be reindexed to match DataFrame index
-        # use_df = use_df[df_filter][column_list]
-        # now using:
-        use_df = use_df.loc[df_filter, column_list]
-
-    log.info(
-            f'plot_history_df start_date={start_date} '
-            f'df.index={len(use_df.index)} column_list={column_list}')
+            'plot_history_df start_date=%s '
+            'df.index=%d column_list=%s',
+            start_date,
+            len(use_df.index),
+            column_list)
 
     if dropna_for_all:
         use_df = use_df.dropna(axis=0, how='any')
@@ -246,12 +487,85 @@ def plot_trading_history(
             log.info('plot_history_df dropna_for_all')
     # end of pre-plot dataframe scrubbing
 
-    ae_charts.set_common_seaborn_fonts()
-
-    hex_color = ae_consts.PLOT_COLORS['blue']
+    if (
+            max_points and
+            linestyle == '-' and
+            len(use_df.index) > max_points):
+        keep_idxs = _downsample_indices(
+            df=use_df,
+            plot_columns=plot_cols,
+            max_points=max_points)
+        if verbose:
+            log.info(
+                'plot_history_df downsample '
+                'rows=%d kept=%d max_points=%d',
+                len(use_df.index),
+                len(keep_idxs),
+                max_points)
+        use_df = use_df.iloc[keep_idxs]
+    # end of downsampling before rendering
+
+    use_cache_path = None
+    if cache_dir and not show_plot:
+        # hash the plotted rows once - the cache key below
+        # and rec['df_fingerprint'] both reuse this pass
+        rec['df_fingerprint'] = _dataframe_fingerprint(use_df)
+        # every argument that changes the rendered pixels
+        # must land in the key - plot_colors carries the
+        # effective trace colors in plotted order and the
+        # caller-provided footnote_text is hashed instead of
+        # the timestamped default so repeat runs still hit
+        use_cache_key = _build_figure_cache_key(
+            df_fingerprint=rec['df_fingerprint'],
+            cache_parts=(
+                title,
+                column_list,
+                tuple(plot_colors),
+                red_label,
+                blue_label,
+                green_label,
+                orange_label,
+                xlabel,
+                ylabel,
+                footnote_text,
+                footnote_xpos,
+                footnote_ypos,
+                footnote_color,
+                footnote_fontsize,
+                start_date,
+                linestyle,
+                width,
+                height,
+                scale_y,
+                low_precision,
+                max_points))
+        use_cache_path = os.path.join(
+            cache_dir,
+            f'{use_cache_key}.png')
+        # the slack post is a side effect the cache cannot
+        # replay - keep rendering when deliveries are on so
+        # enabling the cache never drops a post
+        if (
+                not send_plots_to_slack and
+                os.path.exists(use_cache_path)):
+            if verbose:
+                log.info(
+                    'plot_history_df cache hit path=%s',
+                    use_cache_path)
+            rec['cache_png'] = use_cache_path
+            return build_result.build_result(
+                status=ae_consts.SUCCESS,
+                err=None,
+                rec=rec)
+    # end of checking the figure cache
+
+    global _COMMON_FONTS_SET
+    if not _COMMON_FONTS_SET:
+        ae_charts.set_common_seaborn_fonts()
+        _COMMON_FONTS_SET = True
+
+    hex_color = _BLUE
     fig, ax = plt.subplots(
-        sharex=True,
-        sharey=True,
         figsize=(
             width,
             height))
@@ -262,48 +576,53 @@ def plot_trading_history(
         ae_utils.get_trade_open_xticks_from_date_col(
             use_df[date_col])
 
-    """
-    hit the slice warning with this approach before
-    and one trying df[date_col] = df[date_col].dt.strftime
-
-    SettingWithCopyWarning
-    Try using .loc[row_indexer,col_indexer] = value instead
-
-    use_df[date_col].replace(
-        use_df[date_col].dt.strftime(
-            ae_consts.COMMON_TICK_DATE_FORMAT),
-        inplace=True)
-    trying this:
-    https://stackoverflow.com/questions/19738169/
-    convert-column-of-date-objects-in-pandas-dataframe-to-strings
-    """
-    use_df[date_col] = use_df[date_col].apply(lambda x: x.strftime(
-        ae_consts.COMMON_TICK_DATE_FORMAT))
-
-    all_axes = []
-    num_plots = len(all_plots)
-    first_ax = None
-    for idx, node in enumerate(all_plots):
-        column_name = node['column']
-        hex_color = node['color']
-
-        use_ax = ax
-        if idx > 0:
-            use_ax = ax.twinx()
-        else:
-            first_ax = ax
+    # vectorized strftime - one pandas pass over the date
+    # column instead of a python-level apply per row, and
+    # assign sidesteps the SettingWithCopyWarning the
+    # in-place versions hit before
+    use_df = use_df.assign(**{
+        date_col: use_df[date_col].dt.strftime(
+            ae_consts.COMMON_TICK_DATE_FORMAT)})
+
+    # extract the date values once as a raw numpy array
+    # so each trace below skips pandas' per-plot
+    # series-to-array conversion overhead
+    date_values = use_df[date_col].values
+
+    # extract each plotted column once too - float64 drops to
+    # float32 by default since the renderer only needs
+    # screen-pixel precision
+    y_values = {}
+    for column_name in plot_cols:
+        col_values = use_df[column_name].values
+        if low_precision and col_values.dtype == np.float64:
+            col_values = col_values.astype(np.float32)
+        y_values[column_name] = col_values
+    # end of extracting the plotted columns
+
+    num_plots = len(plot_cols)
+    # create the primary axis plus every twin axis in one
+    # pass - each twinx() runs full axis initialization so
+    # it should not interleave with rendering in the loop
+    all_axes = [ax] + [
+        ax.twinx() for _ in range(num_plots - 1)]
+    first_ax = ax
+    for idx, (column_name, hex_color) in enumerate(
+            zip(plot_cols, plot_colors)):
+        use_ax = all_axes[idx]
 
         if verbose:
             log.info(
-                f'plot_history_df - '
-                f'{idx + 1}/{num_plots} - '
-                f'{column_name} in {hex_color} - '
-                f'ax={use_ax}')
+                'plot_history_df - %d/%d - %s in %s - ax=%s',
+                idx + 1,
+                num_plots,
+                column_name,
+                hex_color,
+                use_ax)
 
-        all_axes.append(use_ax)
         use_ax.plot(
-            use_df[date_col],
-            use_df[column_name],
+            date_values,
+            y_values[column_name],
             linestyle=linestyle,
             color=hex_color)
         if idx > 0:
@@ -312,6 +631,10 @@ def plot_trading_history(
                     [0, use_ax.get_ylim()[1] * 3])
             use_ax.yaxis.set_ticklabels([])
             use_ax.yaxis.set_ticks([])
+            # the twins share the primary x-axis - hide
+            # theirs so matplotlib skips regenerating the
+            # same ticks per twin
+            use_ax.xaxis.set_visible(False)
             use_ax.xaxis.grid(False)
             use_ax.yaxis.grid(False)
         # end if this is not the fist axis
@@ -320,12 +643,24 @@ def plot_trading_history(
     first_ax.set_xticks(date_strings)
     first_ax.set_xticklabels(date_labels, rotation=45, ha='right')
 
-    lines = []
+    # dedup legend entries by label with a dict - insertion
+    # order is preserved and each lookup is O(1) instead of a
+    # linear scan (the old membership test compared labels
+    # against line objects and never matched)
+    lines_by_label = {}
     for idx, cur_ax in enumerate(all_axes):
         ax_lines = cur_ax.get_lines()
         for line in ax_lines:
             label_name = str(line.get_label())
             use_label = label_name
+            if (
+                    label_name.startswith('_') and
+                    idx < len(plot_cols)):
+                # matplotlib auto-labels lines '_childN' -
+                # default to the plotted column name so every
+                # trace keeps its own legend entry instead of
+                # all deduping onto one auto label
+                use_label = plot_cols[idx]
             if idx == 0:
                 if red_label:
                     use_label = red_label
@@ -333,32 +668,29 @@ def plot_trading_history(
                 if blue_label:
                     use_label = blue_label
             elif idx == 2:
-                use_label = label_name[-20:]
                 if green_label:
                     use_label = green_label
+                else:
+                    use_label = use_label[-20:]
             elif idx == 3:
-                use_label = label_name[-20:]
                 if orange_label:
                     use_label = orange_label
+                else:
+                    use_label = use_label[-20:]
             else:
-                if len(label_name) > 10:
-                    use_label = label_name[-20:]
+                if len(use_label) > 10:
+                    use_label = use_label[-20:]
             # end of fixing the labels in the legend
             line.set_label(use_label)
-            if line.get_label() not in lines:
-                lines.append(line)
+            lines_by_label.setdefault(use_label, line)
         rec[f'ax{idx + 1}'] = cur_ax
+    lines = list(lines_by_label.values())
     # end of compiling a new-shortened legend while removing dupes
 
-    for idx, cur_ax in enumerate(all_axes):
-        if cur_ax:
-            if cur_ax.get_legend():
-                cur_ax.get_legend().remove()
-    # end of removing all previous legends
-
-    if verbose:
+    if verbose and log.isEnabledFor(logging.INFO):
         log.info(
-            f'legend lines={[l.get_label() for l in lines]}')
+            'legend lines=%s',
+            list(lines_by_label.keys()))
     # log what's going to be in the legend
 
     ax.legend(
@@ -369,8 +701,8 @@ def plot_trading_history(
 
     fig.autofmt_xdate()
 
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
 
     ax.set_title(title)
     ae_charts.add_footnote(
@@ -380,7 +712,22 @@ def plot_trading_history(
         text=use_footnote,
         color=footnote_color,
         fontsize=footnote_fontsize)
-    plt.tight_layout()
+    if show_plot or send_plots_to_slack:
+        # the layout engine measures every artist in the
+        # figure - only pay for that pass when someone will
+        # see the full window; cached pngs get a tight bbox
+        # computed at save time instead
+        fig.tight_layout()
+
+    if use_cache_path:
+        # exist_ok so plot_many workers sharing one
+        # cache_dir cannot race each other on the mkdir
+        os.makedirs(cache_dir, exist_ok=True)
+        fig.savefig(
+            use_cache_path,
+            bbox_inches='tight')
+        rec['cache_png'] = use_cache_path
+    # end of saving to the figure cache
 
     if send_plots_to_slack:
         slack_utils.post_plot(plt, title=title)
@@ -388,7 +735,11 @@ def plot_trading_history(
     if show_plot:
         plt.show()
     else:
-        plt.plot()
+        # release pyplot's strong reference to the figure so
+        # batch backtests do not accumulate every rendered
+        # figure in matplotlib's registry - the fig handle in
+        # rec keeps the figure alive for callers that want it
+        plt.close(fig)
 
     rec['fig'] = fig
 
@@ -399,3 +750,56 @@ def plot_trading_history(
 
     return result
 # end of plot_history_df
+
+
+def _plot_one(job):
+    """_plot_one
+
+    Render a single job from ``plot_many`` - runs inside a
+    worker process so the plot is never shown
+
+    :param job: dictionary of keyword arguments for
+        ``plot_trading_history``
+    """
+    # workers never display anything - render on Agg no
+    # matter which backend the parent process forked with
+    matplotlib.use('Agg', force=False)
+    use_job = dict(job)
+    use_job['show_plot'] = False
+    res = plot_trading_history(**use_job)
+    if use_job.get('cache_dir') and res.get('rec'):
+        # the cached png path is the deliverable - drop the
+        # figure and axes so they are not pickled back to
+        # the parent process
+        for rec_key in ['ax1', 'ax2', 'ax3', 'ax4', 'fig']:
+            res['rec'].pop(rec_key, None)
+    return res
+# end of _plot_one
+
+
+def plot_many(
+        jobs,
+        workers=None):
+    """plot_many
+
+    Render many ``Trading History`` plots across worker
+    processes - matplotlib is not thread-safe but renders
+    fine in forked workers, so backtest report generation
+    over hundreds of tickers scales with the cores on the
+    machine instead of running serially
+
+    Each job renders with ``show_plot=False`` - pass a
+    ``cache_dir`` in the jobs to get back light results
+    holding just the rendered png path in
+    ``rec['cache_png']``
+
+    :param jobs: list of dictionaries of keyword arguments
+        for ``plot_trading_history``
+    :param workers: optional - int number of worker
+        processes
+        (default is the number of cores)
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers) as executor:
+        return list(executor.map(_plot_one, jobs))
+# end of plot_many
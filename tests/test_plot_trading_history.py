@@ -0,0 +1,205 @@
+"""
+Test file for:
+Plot Trading History
+"""
+
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.plot_trading_history as plot_history
+from analysis_engine.mocks.base_test import BaseTestCase
+
+
+class TestPlotTradingHistory(BaseTestCase):
+    """TestPlotTradingHistory"""
+
+    df = None
+
+    def setUp(
+            self):
+        """setUp"""
+        dates = pd.date_range(
+            '2019-02-01 09:30:00',
+            periods=90,
+            freq='1min')
+        self.df = pd.DataFrame({
+            'minute': dates,
+            'high': np.linspace(100.0, 110.0, 90),
+            'close': np.linspace(99.0, 109.0, 90)})
+    # end of setUp
+
+    def test_downsample_keeps_endpoints_and_extrema(self):
+        """test_downsample_keeps_endpoints_and_extrema"""
+        num_rows = 5000
+        max_points = 200
+        close_values = np.sin(
+            np.linspace(0.0, 20.0, num_rows))
+        close_values[1234] = 50.0
+        close_values[3456] = -50.0
+        df = pd.DataFrame({
+            'close': close_values})
+
+        keep_idxs = plot_history._downsample_indices(
+            df=df,
+            plot_columns=['close'],
+            max_points=max_points)
+
+        self.assertEqual(
+            keep_idxs[0],
+            0)
+        self.assertEqual(
+            keep_idxs[-1],
+            num_rows - 1)
+        self.assertIn(
+            1234,
+            keep_idxs)
+        self.assertIn(
+            3456,
+            keep_idxs)
+        self.assertLessEqual(
+            len(keep_idxs),
+            max_points + 2)
+    # end of test_downsample_keeps_endpoints_and_extrema
+
+    def test_downsample_skips_nan_rows(self):
+        """test_downsample_skips_nan_rows"""
+        close_values = np.arange(1000.0)
+        # several all-NaN buckets at max_points=20
+        close_values[100:300] = np.nan
+        df = pd.DataFrame({
+            'close': close_values})
+
+        keep_idxs = plot_history._downsample_indices(
+            df=df,
+            plot_columns=['close'],
+            max_points=20)
+
+        for keep_idx in keep_idxs:
+            self.assertGreaterEqual(
+                keep_idx,
+                0)
+            self.assertLess(
+                keep_idx,
+                1000)
+        self.assertFalse(
+            np.isnan(
+                close_values[keep_idxs]).any())
+    # end of test_downsample_skips_nan_rows
+
+    def test_downsample_numba_and_numpy_parity(self):
+        """test_downsample_numba_and_numpy_parity"""
+        np.random.seed(42)
+        close_values = np.random.randn(3000)
+        close_values[500:700] = np.nan
+        df = pd.DataFrame({
+            'close': close_values})
+
+        default_idxs = plot_history._downsample_indices(
+            df=df,
+            plot_columns=['close'],
+            max_points=100)
+        saved_njit = plot_history.njit
+        try:
+            # force the numpy fallback path
+            plot_history.njit = None
+            fallback_idxs = plot_history._downsample_indices(
+                df=df,
+                plot_columns=['close'],
+                max_points=100)
+        finally:
+            plot_history.njit = saved_njit
+
+        self.assertEqual(
+            default_idxs,
+            fallback_idxs)
+    # end of test_downsample_numba_and_numpy_parity
+
+    def test_cache_key_stability(self):
+        """test_cache_key_stability"""
+        first_fp = plot_history._dataframe_fingerprint(
+            self.df)
+        self.assertEqual(
+            first_fp,
+            plot_history._dataframe_fingerprint(
+                self.df))
+
+        changed_df = self.df.copy()
+        changed_df.loc[0, 'high'] += 1.0
+        self.assertNotEqual(
+            first_fp,
+            plot_history._dataframe_fingerprint(
+                changed_df))
+
+        cache_parts = (
+            'title',
+            ['minute', 'high', 'close'],
+            'red label')
+        self.assertEqual(
+            plot_history._build_figure_cache_key(
+                df_fingerprint=first_fp,
+                cache_parts=cache_parts),
+            plot_history._build_figure_cache_key(
+                df_fingerprint=first_fp,
+                cache_parts=cache_parts))
+        self.assertNotEqual(
+            plot_history._build_figure_cache_key(
+                df_fingerprint=first_fp,
+                cache_parts=cache_parts),
+            plot_history._build_figure_cache_key(
+                df_fingerprint=first_fp,
+                cache_parts=(
+                    'title',
+                    ['minute', 'high', 'close'],
+                    'another label')))
+    # end of test_cache_key_stability
+
+    def test_figure_cache_hit_and_miss(self):
+        """test_figure_cache_hit_and_miss"""
+        cache_dir = tempfile.mkdtemp(
+            suffix='_plot_cache')
+        try:
+            miss_res = plot_history.plot_trading_history(
+                title='test figure cache',
+                df=self.df,
+                show_plot=False,
+                cache_dir=cache_dir)
+            self.assertEqual(
+                miss_res['status'],
+                ae_consts.SUCCESS)
+            miss_rec = miss_res['rec']
+            self.assertIsNotNone(
+                miss_rec['fig'])
+            self.assertIsNotNone(
+                miss_rec['df_fingerprint'])
+            self.assertTrue(
+                os.path.exists(
+                    miss_rec['cache_png']))
+
+            hit_res = plot_history.plot_trading_history(
+                title='test figure cache',
+                df=self.df,
+                show_plot=False,
+                cache_dir=cache_dir)
+            self.assertEqual(
+                hit_res['status'],
+                ae_consts.SUCCESS)
+            hit_rec = hit_res['rec']
+            self.assertEqual(
+                hit_rec['cache_png'],
+                miss_rec['cache_png'])
+            self.assertEqual(
+                hit_rec['df_fingerprint'],
+                miss_rec['df_fingerprint'])
+            # cache hits never build the figure
+            self.assertIsNone(
+                hit_rec['fig'])
+        finally:
+            shutil.rmtree(
+                cache_dir,
+                ignore_errors=True)
+    # end of test_figure_cache_hit_and_miss
+
+# end of TestPlotTradingHistory